@@ -1,13 +1,41 @@
-import requests, json, random
+import json, os, random
 
-f = open("./README.md", "w")
 pokemon_id = random.randint(1, 1025)
-res = requests.get(f'https://pokeapi.co/api/v2/pokemon/{pokemon_id}')
-result = json.loads(res.text)
-f.write(f'''<p align="center">
+use_cache = os.environ.get('POKEMON_CACHE') == '1'
+cache_path = f'./cache/pokemon_{pokemon_id}.json'
+result = None
+if use_cache:
+    try:
+        with open(cache_path, 'rb') as cache:
+            result = json.load(cache)
+    except (OSError, ValueError):
+        # missing or unreadable entry counts as a miss, the fetch below overwrites it
+        pass
+if result is None:
+    # requests is only needed on a cache miss and is slow to import
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))))
+    res = session.get(f'https://pokeapi.co/api/v2/pokemon/{pokemon_id}', timeout=10)
+    res.raise_for_status()
+    result = json.loads(res.content)
+    if use_cache:
+        # only keep the fields the README uses, the full payload is mostly moves
+        result = {'name': result['name'], 'sprites': {'front_default': result['sprites']['front_default']}}
+        os.makedirs('./cache', exist_ok=True)
+        with open(cache_path + '.tmp', 'w') as cache:
+            json.dump(result, cache)
+        os.replace(cache_path + '.tmp', cache_path)
+
+# write next to README.md and swap it in, so a failed or killed run never leaves it truncated
+with open("./README.md.tmp", "wb") as f:
+    f.write(f'''<p align="center">
     <img src="{result['sprites']['front_default']}" width="150" height="150">
 </p>
 <h3 align="center">You have been greeted by - <b>{result['name'].title()}</b></h3>
 <h3 align="center">Have a wonderful day!</h3>
-''')
-f.close()
+'''.encode())
+os.replace("./README.md.tmp", "./README.md")